@@ -1,52 +1,108 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
 import xml.etree.ElementTree as ET
+from lxml import etree
+import lxml.html
 from urllib.parse import quote_plus
 import argparse
 import concurrent.futures
+import multiprocessing
 import time
 import sys
 import re
+from functools import lru_cache
 from datetime import datetime, UTC
-import json
+import orjson
 import csv
 import os
 from typing import List, Dict, Union
 
-def parse_page(url: str, page_num: int, verbose: bool = False) -> List[Dict[str, str]]:
+_BASE_URL = "https://browser.geekbench.com"
+_HAS_CLASS = "contains(concat(' ', normalize-space(@class), ' '), ' {} ')"
+_ROWS_XPATH = etree.XPath(f"//div[{_HAS_CLASS.format('list-col')}]")
+_LINK_XPATH = etree.XPath(
+    f"((.//div[{_HAS_CLASS.format('col-12')} and {_HAS_CLASS.format('col-lg-4')}])[1]//a)[1]")
+_MODEL_XPATH = etree.XPath(f"(.//span[{_HAS_CLASS.format('list-col-model')}])[1]")
+_SCORES_XPATH = etree.XPath(f".//span[{_HAS_CLASS.format('list-col-text-score')}]")
+_PAGE_LINKS_XPATH = etree.XPath(
+    f"(//ul[{_HAS_CLASS.format('pagination')}])[1]//a[{_HAS_CLASS.format('page-link')}]")
+_TIMEOUT = (3.05, 10)
+_WRITE_BUFFER = 1 << 20
+_CACHE_NAME = '.geekscraper_cache'
+_CACHE_EXPIRE_AFTER = 3600
+_FILENAME_UNSAFE_RE = re.compile(r'[^a-zA-Z0-9_-]')
+
+def create_session(pool_size: int, use_cache: bool = True) -> requests.Session:
+    """Create an HTTP session keeping one connection alive per worker thread"""
+    if use_cache:
+        session = CachedSession(_CACHE_NAME, expire_after=_CACHE_EXPIRE_AFTER, allowable_methods=('GET',))
+    else:
+        session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_maxsize=pool_size, max_retries=Retry(total=3, backoff_factor=0.3)))
+    return session
+
+def _extract_rows(tree: lxml.html.HtmlElement, verbose: bool = False) -> List[Dict[str, str]]:
+    rows = []
+
+    for result in _ROWS_XPATH(tree):
+        model_span = _MODEL_XPATH(result)
+        if not model_span:
+            if verbose:
+                print("  [Error] Parsing result: no model found")
+            continue
+
+        result_link = _LINK_XPATH(result)
+        result_link = result_link[0] if result_link else None
+        href = result_link.get('href') if result_link is not None else None
+        result_url = _BASE_URL + href if href else None
+
+        system = sys.intern(result_link.text_content().strip()) if result_link is not None else "Unknown"
+        model = sys.intern(' '.join(s.strip() for s in model_span[0].itertext() if s.strip()))
+
+        scores = _SCORES_XPATH(result)
+        single_core = scores[0].text_content().strip() if len(scores) > 0 else "N/A"
+        multi_core = scores[1].text_content().strip() if len(scores) > 1 else "N/A"
+
+        rows.append({
+            'system': system,
+            'model': model,
+            'single_core': single_core,
+            'multi_core': multi_core,
+            'url': result_url
+        })
+
+    return rows
+
+@lru_cache(maxsize=None)
+def _html_parser(encoding: str) -> lxml.html.HTMLParser:
+    return lxml.html.HTMLParser(encoding=encoding)
+
+def _parse_tree(content: bytes, encoding: Union[str, None]) -> lxml.html.HtmlElement:
+    return lxml.html.fromstring(content, parser=_html_parser(encoding or 'utf-8'))
+
+def parse_html(content: bytes, encoding: Union[str, None], verbose: bool = False) -> List[Dict[str, str]]:
+    """Parse the result rows out of a search page's raw HTML"""
+    return _extract_rows(_parse_tree(content, encoding), verbose)
+
+def parse_page(session: requests.Session, url: str, page_num: int, verbose: bool = False,
+               parse_pool: concurrent.futures.Executor = None) -> List[Dict[str, str]]:
     if verbose:
         print(f"[Page {page_num}] Fetching: {url}")
 
     try:
         start_time = time.time()
-        response = requests.get(url)
+        response = session.get(url, timeout=_TIMEOUT)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        page_results = []
-
-        for result in soup.select('div.list-col'):
-            try:
-
-                result_link = result.select_one('div.col-12.col-lg-4 a')
-                result_url = f"https://browser.geekbench.com{result_link['href']}" if result_link else None
-
-                system = result_link.text.strip() if result_link else "Unknown"
-                model = ' '.join(result.select_one('span.list-col-model').stripped_strings)
-
-                scores = result.select('span.list-col-text-score')
-                single_core = scores[0].text.strip() if len(scores) > 0 else "N/A"
-                multi_core = scores[1].text.strip() if len(scores) > 1 else "N/A"
-
-                page_results.append({
-                    'system': system,
-                    'model': model,
-                    'single_core': single_core,
-                    'multi_core': multi_core,
-                    'url': result_url
-                })
-            except Exception as e:
-                if verbose:
-                    print(f"  [Error] Parsing result: {str(e)}")
+        if parse_pool:
+            page_results = parse_pool.submit(parse_html, response.content, response.encoding, verbose).result()
+            # Strings unpickled from the worker are fresh copies, re-intern them here
+            for row in page_results:
+                row['system'] = sys.intern(row['system'])
+                row['model'] = sys.intern(row['model'])
+        else:
+            page_results = parse_html(response.content, response.encoding, verbose)
 
         elapsed = time.time() - start_time
         if verbose:
@@ -58,10 +114,11 @@ def parse_page(url: str, page_num: int, verbose: bool = False) -> List[Dict[str,
             print(f"[Page {page_num}] Error: {str(e)}")
         return []
 
-def parse_geekbench(query: str, max_pages: int = None, threads: int = 1, verbose: bool = False) -> List[Dict[str, str]]:
-    base_url = "https://browser.geekbench.com"
-    search_url = f"{base_url}/search?q={quote_plus(query)}"
+def parse_geekbench(query: str, max_pages: int = None, threads: int = 1, verbose: bool = False,
+                    use_cache: bool = True) -> List[Dict[str, str]]:
+    search_url = f"{_BASE_URL}/search?q={quote_plus(query)}"
     all_benchmarks = []
+    session = create_session(threads, use_cache)
 
     if verbose:
         print(f"Starting search for: '{query}'")
@@ -69,17 +126,15 @@ def parse_geekbench(query: str, max_pages: int = None, threads: int = 1, verbose
 
     try:
 
-        first_page = requests.get(search_url)
+        first_page = session.get(search_url, timeout=_TIMEOUT)
         first_page.raise_for_status()
-        soup = BeautifulSoup(first_page.text, 'html.parser')
+        tree = _parse_tree(first_page.content, first_page.encoding)
 
-        pagination = soup.select_one('ul.pagination')
         total_pages = 1
-        if pagination:
-            page_links = [a for a in pagination.select('a.page-link') 
-                         if a.text.strip().isdigit()]
-            if page_links:
-                total_pages = max(int(a.text) for a in page_links)
+        page_links = [a for a in _PAGE_LINKS_XPATH(tree)
+                     if a.text_content().strip().isdigit()]
+        if page_links:
+            total_pages = max(int(a.text_content()) for a in page_links)
 
         pages_to_fetch = min(total_pages, max_pages) if max_pages else total_pages
 
@@ -87,17 +142,34 @@ def parse_geekbench(query: str, max_pages: int = None, threads: int = 1, verbose
             print(f"Total pages available: {total_pages}")
             print(f"Pages to fetch: {pages_to_fetch}")
 
-        urls = [search_url]  
-        for page in range(2, pages_to_fetch + 1):
-            urls.append(f"{search_url}&page={page}")
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
-            futures = []
-            for i, url in enumerate(urls, 1):
-                futures.append(executor.submit(parse_page, url, i, verbose))
-
-            for future in concurrent.futures.as_completed(futures):
-                all_benchmarks.extend(future.result())
+        all_benchmarks.extend(_extract_rows(tree, verbose))
+        if verbose:
+            print(f"[Page 1] Found {len(all_benchmarks)} results")
+
+        urls = [f"{search_url}&page={page}" for page in range(2, pages_to_fetch + 1)]
+
+        # Each fetcher thread waits on its own page's parse, so more parse
+        # processes than threads would never be busy
+        parse_workers = min(os.cpu_count() or 1, threads, len(urls))
+        parse_pool = None
+        if parse_workers > 1:
+            # Workers start from inside a fetcher thread, so forking the live
+            # process could copy a lock another thread is holding
+            start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            parse_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=parse_workers, mp_context=multiprocessing.get_context(start_method))
+
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+                futures = []
+                for i, url in enumerate(urls, 2):
+                    futures.append(executor.submit(parse_page, session, url, i, verbose, parse_pool))
+
+                for future in concurrent.futures.as_completed(futures):
+                    all_benchmarks.extend(future.result())
+        finally:
+            if parse_pool:
+                parse_pool.shutdown()
 
         if verbose:
             print(f"\nTotal results collected: {len(all_benchmarks)}")
@@ -107,59 +179,82 @@ def parse_geekbench(query: str, max_pages: int = None, threads: int = 1, verbose
         if verbose:
             print(f"Critical error: {str(e)}")
         return []
+    finally:
+        session.close()
 
 def calculate_statistics(benchmarks: List[Dict[str, str]]) -> Dict[str, float]:
-    """Calculate statistics from benchmark results"""
-    valid_scores = [
-        (int(b['single_core']), int(b['multi_core']))
-        for b in benchmarks
-        if b['single_core'].isdigit() and b['multi_core'].isdigit()
-    ]
-
-    if not valid_scores:
+    """Calculate statistics from benchmark results in a single pass"""
+    count = 0
+    single_sum = multi_sum = 0
+    single_min = single_max = multi_min = multi_max = 0
+
+    for b in benchmarks:
+        try:
+            single = int(b['single_core'])
+            multi = int(b['multi_core'])
+        except (TypeError, ValueError):
+            continue
+
+        if count == 0:
+            single_min = single_max = single
+            multi_min = multi_max = multi
+        else:
+            if single < single_min:
+                single_min = single
+            elif single > single_max:
+                single_max = single
+            if multi < multi_min:
+                multi_min = multi
+            elif multi > multi_max:
+                multi_max = multi
+
+        single_sum += single
+        multi_sum += multi
+        count += 1
+
+    if not count:
         return {}
 
-    single_scores = [s[0] for s in valid_scores]
-    multi_scores = [s[1] for s in valid_scores]
-
     return {
-        "mean_single_core": round(sum(single_scores) / len(single_scores), 2),
-        "mean_multi_core": round(sum(multi_scores) / len(multi_scores), 2),
-        "min_single_core": min(single_scores),
-        "max_single_core": max(single_scores),
-        "min_multi_core": min(multi_scores),
-        "max_multi_core": max(multi_scores),
-        "sample_count": len(valid_scores)
+        "mean_single_core": round(single_sum / count, 2),
+        "mean_multi_core": round(multi_sum / count, 2),
+        "min_single_core": single_min,
+        "max_single_core": single_max,
+        "min_multi_core": multi_min,
+        "max_multi_core": multi_max,
+        "sample_count": count
     }
 
+def _write_xml_element(xf: etree.xmlfile, tag: str, text: Union[str, None]) -> None:
+    with xf.element(tag):
+        if text:
+            xf.write(text)
+
 def create_xml_output(benchmarks: List[Dict[str, str]], output_file: str) -> None:
-    """Create XML output file"""
-    root = ET.Element('benchmarks')
-    for bench in benchmarks:
-        benchmark_elem = ET.SubElement(root, 'benchmark')
-        ET.SubElement(benchmark_elem, 'system').text = bench['system']
-        ET.SubElement(benchmark_elem, 'model').text = bench['model']
-        ET.SubElement(benchmark_elem, 'single_core_score').text = bench['single_core']
-        ET.SubElement(benchmark_elem, 'multi_core_score').text = bench['multi_core']
-        if 'url' in bench:
-            ET.SubElement(benchmark_elem, 'url').text = bench['url']
-
-    xml_str = ET.tostring(root, encoding='utf-8', method='xml').decode()
-    with open(output_file, 'w') as f:
-        f.write(xml_str)
+    """Create XML output file, streaming one benchmark element at a time"""
+    with open(output_file, 'wb', buffering=_WRITE_BUFFER) as f, etree.xmlfile(f, encoding='utf-8') as xf:
+        xf.write_declaration()
+        with xf.element('benchmarks'):
+            for bench in benchmarks:
+                with xf.element('benchmark'):
+                    _write_xml_element(xf, 'system', bench['system'])
+                    _write_xml_element(xf, 'model', bench['model'])
+                    _write_xml_element(xf, 'single_core_score', bench['single_core'])
+                    _write_xml_element(xf, 'multi_core_score', bench['multi_core'])
+                    if 'url' in bench:
+                        _write_xml_element(xf, 'url', bench['url'])
     print(f"XML output saved to {output_file}")
 
 def create_json_output(benchmarks: List[Dict[str, str]], output_file: str) -> None:
     """Create JSON output file with detailed results"""
-    with open(output_file, 'w') as f:
-        json.dump(benchmarks, f, indent=4)
+    with open(output_file, 'wb', buffering=_WRITE_BUFFER) as f:
+        f.write(orjson.dumps(benchmarks, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
     print(f"JSON output saved to {output_file}")
 
-def create_stats_output(benchmarks: List[Dict[str, str]], output_file: str) -> None:
-    """Create JSON file with statistics only"""
-    stats = calculate_statistics(benchmarks)
-    with open(output_file, 'w') as f:
-        json.dump(stats, f, indent=4)
+def create_stats_output(stats: Dict[str, float], output_file: str) -> None:
+    """Create JSON file with precomputed statistics"""
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(stats, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
     print(f"Statistics JSON saved to {output_file}")
 
 def create_csv_output(benchmarks: List[Dict[str, str]], output_file: str) -> None:
@@ -168,15 +263,16 @@ def create_csv_output(benchmarks: List[Dict[str, str]], output_file: str) -> Non
     if benchmarks and 'url' in benchmarks[0]:
         fieldnames.append("url")
 
-    with open(output_file, 'w', newline='') as f:
+    with open(output_file, 'w', newline='', buffering=_WRITE_BUFFER) as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
         writer.writerows(benchmarks)
     print(f"CSV output saved to {output_file}")
 
+@lru_cache(maxsize=256)
 def safe_filename_component(s: str) -> str:
     """Sanitize string for use in filenames"""
-    return re.sub(r'[^a-zA-Z0-9_-]', '_', s)
+    return _FILENAME_UNSAFE_RE.sub('_', s)
 
 def parse_input_file(file_path: str) -> Union[List[Dict[str, str]], None]:
     """Parse an input file containing benchmark results"""
@@ -187,20 +283,25 @@ def parse_input_file(file_path: str) -> Union[List[Dict[str, str]], None]:
     try:
         with open(file_path, 'r') as f:
             if file_path.endswith('.json'):
-                return json.load(f)
+                return orjson.loads(f.read())
             elif file_path.endswith('.xml'):
-                tree = ET.parse(file_path)
-                root = tree.getroot()
-                return [
-                    {
-                        'system': item.find('system').text if item.find('system') is not None else "Unknown",
-                        'model': item.find('model').text if item.find('model') is not None else "Unknown",
-                        'single_core': item.find('single_core_score').text if item.find('single_core_score') is not None else "N/A",
-                        'multi_core': item.find('multi_core_score').text if item.find('multi_core_score') is not None else "N/A",
-                        'url': item.find('url').text if item.find('url') is not None else None
-                    }
-                    for item in root.findall('benchmark')
-                ]
+                rows = []
+                root = None
+                for event, item in ET.iterparse(file_path, events=('start', 'end')):
+                    if root is None:
+                        root = item
+                    if event != 'end' or item.tag != 'benchmark':
+                        continue
+                    fields = {child.tag: child.text for child in item}
+                    rows.append({
+                        'system': fields.get('system', "Unknown"),
+                        'model': fields.get('model', "Unknown"),
+                        'single_core': fields.get('single_core_score', "N/A"),
+                        'multi_core': fields.get('multi_core_score', "N/A"),
+                        'url': fields.get('url')
+                    })
+                    root.clear()
+                return rows
             elif file_path.endswith('.csv'):
                 with open(file_path, 'r') as f:
                     reader = csv.DictReader(f)
@@ -224,6 +325,7 @@ def main():
     parser.add_argument('--csv', action='store_true', help='Output results as CSV')
     parser.add_argument('--xml', action='store_true', help='Output results as XML')
     parser.add_argument('--all', action='store_true', help='Output all formats')
+    parser.add_argument('--no-cache', action='store_true', help='Always re-download pages instead of using the 1 hour response cache')
 
     args = parser.parse_args()
 
@@ -245,7 +347,8 @@ def main():
     else:
         print(f"Searching for: '{args.query}' with {args.threads} thread(s)")
         start_time = time.time()
-        results = parse_geekbench(args.query, max_pages=args.pages, threads=args.threads, verbose=verbose)
+        results = parse_geekbench(args.query, max_pages=args.pages, threads=args.threads, verbose=verbose,
+                                  use_cache=not args.no_cache)
         elapsed = time.time() - start_time
         print(f"Scraping completed in {elapsed:.2f} seconds")
 
@@ -275,12 +378,12 @@ def main():
     if output_csv:
         create_csv_output(results, f"{base_name}.csv")
     if output_stats:
+        stats = calculate_statistics(results)
         stats_file = f"{base_name}_stats.json"
-        create_stats_output(results, stats_file)
+        create_stats_output(stats, stats_file)
 
-        stats = calculate_statistics(results)
         print("\nBenchmark Statistics:")
-        print(json.dumps(stats, indent=4))
+        print(orjson.dumps(stats, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file